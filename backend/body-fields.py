@@ -17,24 +17,37 @@ Notice that `Field` is imported directly from `pydantic`, not from
 """
 
 from typing import Union
-from fastapi import Body, FastAPI 
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Body
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import Annotated
 
-app = FastAPI()
+router = APIRouter(prefix="/fields", default_response_class=JSONResponse)
 
-@app.get("/")
+"""
+Note:
+`main.py` serves the lessons with `ORJSONResponse` by default, but this router 
+keeps `JSONResponse`: `update_item` sends `item_id` back, and it can be any 
+`int`. `orjson` can't encode integers bigger than 64 bits, the standard `json` 
+module can.
+"""
+
+@router.get("/")
 async def greet():
     return {"message": "This is Body Fields!"}
 
 class Item(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: Annotated[Union[str, None], Field(title="The description of the item", max_length=300)] = None
     price: Annotated[float, Field(gt=0, description="The price must be greater than zero")]
     tax: Union[float, None] = None
 
-@app.put("/v1/items/{item_id}")
-async def update_item(item_id: int, item: Annotated[Item, Body(embed=True)]):
+ItemBody = Annotated[Item, Body(embed=True)]
+
+@router.put("/v1/items/{item_id}")
+async def update_item(item_id: int, item: ItemBody):
     results = {"item_id": item_id, "item": item}
     return results
 
@@ -19,31 +19,38 @@ taken from the body is optional. As it has a `None` default value.
 """
 
 from typing import Union
-from fastapi import FastAPI, Path
-from pydantic import BaseModel
+from fastapi import APIRouter, Path
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict
 from typing_extensions import Annotated
 
-app = FastAPI()
+router = APIRouter(prefix="/multiple-parameters", default_response_class=JSONResponse)
+
+"""
+Note:
+The responses here are rendered with `JSONResponse` instead of the 
+`ORJSONResponse` that `main.py` uses by default. They include `item_id` (and 
+`importance`), which can be any `int`, and `orjson` only encodes integers that 
+fit in 64 bits.
+"""
 
 
 class Item(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: Union[str, None] = None
     price: float
     tax: Union[float, None] = None
 
 
-@app.put("/v1/items/{item_id}")
+@router.put("/v1/items/{item_id}")
 async def update_item(
     item_id: Annotated[int, Path(title="The ID of the item to get", ge=0, le=1000)],
     q: Union[str, None] = None,
     item: Union[Item, None] = None,
 ):
-    results = {"item_id": item_id}
-    if q:
-        results.update({"q": q})
-    if item:
-        results.update({"item": item})
+    results = {"item_id": item_id, **{k: v for k, v in (("q", q), ("item", item)) if v}}
     return results
 
 """
@@ -97,13 +104,74 @@ like that for the OpenAPI schema and automatic docs.
 
 
 class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     username: str
     full_name: Union[str, None] = None
 
 
-@app.put("/v2/items/{item_id}")
-async def update_item(item_id: int, item: Item, user: User):
-    results = {"item_id": item_id, "item": item, "user": user}
+"""
+Note:
+With more than one body parameter FastAPI builds a model for the whole body on 
+every request, then decodes the JSON and validates each parameter on its own.
+
+In the example below, the body is declared once as `ItemUserBody`, and the raw 
+bytes are validated with a `TypeAdapter` built when the module is imported, in a 
+single pass by pydantic-core's JSON validator (there is no separate decode).
+All the errors are collected in that pass, a missing `"user"` and an invalid 
+`"item"` are reported together, and raised as one `RequestValidationError`, so 
+the client still gets the same `422` response.
+
+The body is documented with `openapi_extra` because it's not a parameter of the 
+function anymore.
+"""
+
+from typing import Any
+
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+
+
+class ItemUserBody(BaseModel):
+    item: Item
+    user: User
+
+
+class ItemBody(BaseModel):
+    item: Item
+
+
+_ITEM_USER_TA = TypeAdapter(ItemUserBody)
+_ITEM_TA = TypeAdapter(ItemBody)
+
+
+def _validate_body(adapter: TypeAdapter, raw: bytes) -> Any:
+    try:
+        return adapter.validate_json(raw)
+    except ValidationError as e:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        raise RequestValidationError(errors)
+
+
+def _embedded_body_schema(**models: type) -> dict:
+    schema = {
+        "type": "object",
+        "properties": {key: model.model_json_schema() for key, model in models.items()},
+        "required": list(models),
+    }
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": schema}},
+            "required": True,
+        }
+    }
+
+
+@router.put("/v2/items/{item_id}", openapi_extra=_embedded_body_schema(item=Item, user=User))
+async def update_item(item_id: int, request: Request):
+    body = _validate_body(_ITEM_USER_TA, await request.body())
+    results = {"item_id": item_id, "item": body.item, "user": body.user}
     return results
 
 """
@@ -142,7 +210,7 @@ Again, it will convert the data types, validate, document, etc.
 
 from fastapi import Body
 
-@app.put("/v3/items/{item_id}")
+@router.put("/v3/items/{item_id}")
 async def update_item(
     item_id: int, 
     item: Item, 
@@ -170,7 +238,7 @@ Or in Python 3.10 and above:
 For example:
 """
 
-@app.put("/v4/items/{item_id}")
+@router.put("/v4/items/{item_id}")
 async def update_item(
     *,
     item_id: int,
@@ -179,9 +247,13 @@ async def update_item(
     importance: Annotated[int, Body(gt=0)],
     q: Union[str, None] = None,
 ):
-    results = {"item_id": item_id, "item": item, "user": user, "importance": importance}
-    if q:
-        results.update({"q": q})
+    results = {
+        "item_id": item_id,
+        "item": item,
+        "user": user,
+        "importance": importance,
+        **({"q": q} if q else {}),
+    }
     return results
 
 """
@@ -227,9 +299,20 @@ Instead of:
     }
 """
 
-@app.put("/v5/items/{item_id}")
-async def update_item(item_id: int, item: Annotated[Item, Body(embed=True)]):
-    results = {"item_id": item_id, "item": item}
+"""
+Note:
+The embedded body can also be read by hand, which skips FastAPI building
+and validating the `{"item": ...}` wrapper around the model.
+
+In the example below, the same helpers as in the `/v2/items/{item_id}` example 
+are used: the raw body is validated in one pass by a `TypeAdapter(ItemBody)`, 
+a model with only the `"item"` key.
+"""
+
+@router.put("/v5/items/{item_id}", openapi_extra=_embedded_body_schema(item=Item))
+async def update_item(item_id: int, request: Request):
+    body = _validate_body(_ITEM_TA, await request.body())
+    results = {"item_id": item_id, "item": body.item}
     return results
 
 
@@ -15,14 +15,53 @@ In the example, below, 'list' will make 'tags' be a list,
 although it doesn't declare the type of the elements of the list.
 """
 
-from typing import Union
-from fastapi import FastAPI
-from pydantic import BaseModel
+from typing import Any, Callable, Union
 
-app = FastAPI()
+import orjson
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ConfigDict
+
+
+class ORJSONRequest(Request):
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request) -> Response:
+            request = ORJSONRequest(request.scope, request.receive)
+            return await original_route_handler(request)
+
+        return custom_route_handler
+
+
+router = APIRouter(prefix="/nested-models", route_class=ORJSONRoute)
+
+"""
+Note:
+The nested bodies in this lesson can get big, so the request body is decoded
+with `orjson` instead of the standard `json` module. `ORJSONRoute` swaps in a
+`Request` whose `.json()` uses `orjson.loads`, everything else (validation,
+errors, docs) works the same.
+
+The route class has to be set before the Path Operations are declared.
+
+The `/vN/items/{item_id}` Path Operations send `item_id` back, and it can be any 
+`int`, so they use `JSONResponse` instead of the `ORJSONResponse` that `main.py` 
+uses by default (`orjson` can't encode integers bigger than 64 bits).
+"""
 
 
 class Item(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: Union[str, None] = None
     price: float
@@ -30,11 +69,18 @@ class Item(BaseModel):
     tags: list = []
 
 
-@app.put("/v1/items/{item_id}")
+@router.put("/v1/items/{item_id}", response_class=JSONResponse)
 async def update_item(item_id: int, item: Item):
     results = {"item_id": item_id, "item": item}
     return results
 
+"""
+Note:
+The models in these lessons are only read after they are validated, so they 
+are declared with `model_config = ConfigDict(frozen=True)`. Assigning to a field 
+of a frozen model raises an error instead of silently changing the data.
+"""
+
 """
 List Fields With Type Parameter
 
@@ -53,6 +99,8 @@ from typing import List
 
 
 class ItemTwo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: Union[str, None] = None
     price: float
@@ -60,7 +108,7 @@ class ItemTwo(BaseModel):
     tags: List[str] = []
 
 
-@app.put("/v2/items/{item_id}")
+@router.put("/v2/items/{item_id}", response_class=JSONResponse)
 async def update_item(item_id: int, item: ItemTwo):
     results = {"item_id": item_id, "item": item}
     return results
@@ -107,20 +155,27 @@ And whenever you output that dat, even if the source had duplicates, it will
 be it will be output as a set of unique items.
 
 And it will be annotated / documented accordingly too.
+
+Note:
+The models only read 'tags' after validation, so they are declared as a
+'frozenset' instead of a 'set'. It validates, dedupes and documents the
+same way (a list with unique items), but the result is immutable.
 """
 
-from typing import Set
+from typing import FrozenSet
 
 
 class ItemThree(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: Union[str, None] = None
     price: float
     tax: Union[float, None] = None
-    tags: Set[str] = set()
+    tags: FrozenSet[str] = frozenset()
 
 
-@app.put("/v3/items/{item_id}")
+@router.put("/v3/items/{item_id}", response_class=JSONResponse)
 async def update_item(item_id: int, item: ItemThree):
     results = {"item_id": item_id, "item": item}
     return results
@@ -170,20 +225,24 @@ Again, doing just for declaration, with FastAPI you get:
 
 
 class Image(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     url: str
     name: str
 
 
 class ItemFour(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: Union[str, None] = None
     price: float
     tax: Union[float, None] = None
-    tags: Set[str] = set()
+    tags: FrozenSet[str] = frozenset()
     image: Union[Image, None] = None
 
 
-@app.put("/v4/items/{item_id}")
+@router.put("/v4/items/{item_id}", response_class=JSONResponse)
 async def update_item(item_id: int, item: ItemFour):
     results = {"item_id": item_id, "item": item}
     return results
@@ -202,26 +261,56 @@ to be instead of a "str", a Pydantic's "HttpUrl".
 
 The string will be checked to be a valid URL, and documented in JSON Schema / 
 OpenAPI as such.
+
+Note:
+Instead of "HttpUrl", the "ImageTwo" model below uses "HttpUrlStr", a plain "str" 
+with an "AfterValidator" that only checks it against a compiled regex. "HttpUrl" 
+fully parses every URL (IDNA hosts, TLDs, etc) and creates a "Url" object for 
+each one, which adds up on bodies with lists of images. The value stays a "str" 
+exactly as it was sent.
+
+"ImageTwo" is also reused for the list of images further below, instead of 
+declaring a new copy of it.
 """
 
-from pydantic import HttpUrl
+import re
+
+from pydantic import AfterValidator, Field
+from typing_extensions import Annotated
+
+_HTTP_URL_RE = re.compile(r"https?://\S+", re.IGNORECASE)
+
+
+def _check_http_url(url: str) -> str:
+    if not _HTTP_URL_RE.fullmatch(url):
+        raise ValueError("URL must start with http:// or https://")
+    return url
+
+
+HttpUrlStr = Annotated[
+    str, AfterValidator(_check_http_url), Field(json_schema_extra={"format": "uri"})
+]
 
 
 class ImageTwo(BaseModel):
-    url: HttpUrl
+    model_config = ConfigDict(frozen=True)
+
+    url: HttpUrlStr
     name: str
 
 
 class ItemFive(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: Union[str, None] = None
     price: float
     tax: Union[float, None] = None
-    tags: Set[str] = set()
+    tags: FrozenSet[str] = frozenset()
     image: Union[ImageTwo, None] = None
 
 
-@app.put("/v5/items/{item_id}")
+@router.put("/v5/items/{item_id}", response_class=JSONResponse)
 async def update_item(item_id: int, item: ItemFive):
     results = {"item_id": item_id, "item": item}
     return results
@@ -259,21 +348,18 @@ and JSON body like:
 """
 
 
-class ImageThree(BaseModel):
-    url: HttpUrl
-    name: str
-
-
 class ItemSix(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: Union[str, None] = None
     price: float
     tax: Union[float, None] = None
-    tags: Set[str] = set()
+    tags: FrozenSet[str] = frozenset()
     images: Union[List[Image], None] = None
 
 
-@app.put("/v6/items/{item_id}")
+@router.put("/v6/items/{item_id}", response_class=JSONResponse)
 async def update_item(item_id: int, item: ItemSix):
     results = {"item_id": item_id, "item": item}
     return results
@@ -285,7 +371,7 @@ You can define arbitrarily deeply nested models.
 
 Notice in the example below, the Offer model has a list 
 of ItemSeven objects, which in turn have an optional list of 
-ImageFour objects.
+Image objects.
 
 FastAPI will expect a JSON body like:
 {
@@ -311,30 +397,87 @@ FastAPI will expect a JSON body like:
 """
 
 
-class ImageFour(BaseModel):
-    url: HttpUrl
-    name: str
-
-
 class ItemSeven(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: Union[str, None] = None
     price: float
     tax: Union[float, None] = None
-    tags: Set[str] = set()
+    tags: FrozenSet[str] = frozenset()
     images: Union[List[Image], None] = None
 
 
 class Offer(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: Union[str, None] = None
     price: float
     item: List[ItemSeven]
 
 
-@app.post("/v1/offers")
-async def create_offer(offer: Offer):
-    return offer
+"""
+Note:
+This is the deepest body in the lesson, and declaring it as the parameter
+`offer: Offer` makes FastAPI decode the JSON into Python objects first and then
+have Pydantic validate those.
+
+Instead, a `TypeAdapter(Offer)` is built once at import, and the raw body bytes
+are validated with it in a single pass by pydantic-core's JSON validator. 
+Validation errors are raised as a `RequestValidationError`, so the client still 
+gets the same `422` response.
+
+The body is then not declared as a parameter anymore, so the schema is
+passed with `openapi_extra` to keep the docs the same.
+"""
+
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+
+
+def _request_body_schema(schema: dict) -> dict:
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": schema}},
+            "required": True,
+        }
+    }
+
+
+async def _validate_body(adapter: TypeAdapter, request: Request) -> Any:
+    try:
+        return adapter.validate_json(await request.body())
+    except ValidationError as e:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        raise RequestValidationError(errors)
+
+
+def _inline_refs(schema: dict) -> dict:
+    defs = schema.pop("$defs", {})
+
+    def inline(value: Any) -> Any:
+        if isinstance(value, dict):
+            if "$ref" in value:
+                return inline(defs[value["$ref"].rsplit("/", 1)[-1]])
+            return {k: inline(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [inline(v) for v in value]
+        return value
+
+    return inline(schema)
+
+
+_OFFER_TA = TypeAdapter(Offer)
+
+
+@router.post(
+    "/v1/offers",
+    openapi_extra=_request_body_schema(_inline_refs(Offer.model_json_schema())),
+)
+async def create_offer(request: Request):
+    offer = await _validate_body(_OFFER_TA, request)
+    return offer.model_dump(mode="json")
 
 """
 Bodies of pure lists
@@ -359,14 +502,23 @@ In the example below, FastAPI will expect a JSON body that looks like:
 """
 
 
-class ImageFive(BaseModel):
-    url: HttpUrl
-    name: str
+"""
+Note:
+The same as with the Offer above, the body is validated by a `TypeAdapter`
+built once at import, here for a `List[ImageTwo]` and below for a `Dict[int, float]`.
+"""
+
+_IMAGES_TA = TypeAdapter(List[ImageTwo])
 
 
-@app.post("/images/multiple/")
-async def create_multiple_images(images: List[ImageFive]):
-    return images
+@router.post(
+    "/images/multiple/",
+    openapi_extra=_request_body_schema(
+        {"type": "array", "items": ImageTwo.model_json_schema()}
+    ),
+)
+async def create_multiple_images(request: Request):
+    return await _validate_body(_IMAGES_TA, request)
 
 """
 Bodies of arbitrary dicts
@@ -409,6 +561,12 @@ keys and 'float' values.
 
 from typing import Dict
 
-@app.post("/index-weights/")
-async def create_index_weights(weights: Dict[int, float]):
-    return weights
\ No newline at end of file
+_WEIGHTS_TA = TypeAdapter(Dict[int, float])
+
+
+@router.post(
+    "/index-weights/",
+    openapi_extra=_request_body_schema(_WEIGHTS_TA.json_schema()),
+)
+async def create_index_weights(request: Request):
+    return await _validate_body(_WEIGHTS_TA, request)
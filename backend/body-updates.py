@@ -11,16 +11,17 @@ to data that can be stored as JSON (e.g., with a NoSQL database).
 For example, converting `datetime` to `str`.
 """
 
-from typing import List, Union
+from typing import Dict, List, Union
 
-from fastapi import FastAPI
-from fastapi.encoders import jsonable_encoder
-from pydantic import BaseModel
+from fastapi import APIRouter
+from pydantic import BaseModel, ConfigDict
 
-app = FastAPI()
+router = APIRouter(prefix="/updates")
 
 
 class Item(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: Union[str, None] = None
     description: Union[str, None] = None
     price: Union[float, None] = None
@@ -28,23 +29,86 @@ class Item(BaseModel):
     tags: List[str] = []
 
 
-items = {
+"""
+Note:
+The items below are not stored as one `dict` per item. Each field has its own 
+`list` (a "column"), and `_idx` maps each item ID to its position in them:
+
+    _idx = {"foo": 0, "bar": 1, "baz": 2}
+    _name = ["Foo", "Bar", "Baz"]
+    _price = [50.2, 62.0, 50.2]
+    ...
+
+Reading an item is one `dict` lookup plus one index per field, and an update 
+only writes the fields it changes in place, without building a new `dict`.
+"""
+
+_idx: Dict[str, int] = {}
+_name: List[Union[str, None]] = []
+_description: List[Union[str, None]] = []
+_price: List[Union[float, None]] = []
+_tax: List[Union[float, None]] = []
+_tags: List[List[str]] = []
+
+_columns = {
+    "name": _name,
+    "description": _description,
+    "price": _price,
+    "tax": _tax,
+    "tags": _tags,
+}
+
+
+def _store_item(item_id: str, data: dict) -> None:
+    i = _idx.get(item_id)
+    if i is None:
+        _idx[item_id] = len(_name)
+        for field, column in _columns.items():
+            column.append(data[field])
+    else:
+        for field, value in data.items():
+            _columns[field][i] = value
+
+
+def _load_item(i: int) -> Item:
+    return Item.model_construct(
+        name=_name[i],
+        description=_description[i],
+        price=_price[i],
+        tax=_tax[i],
+        tags=_tags[i],
+    )
+
+
+def _seed_items(items: Dict[str, dict]) -> None:
+    for item_id, data in items.items():
+        _store_item(item_id, Item(**data).model_dump(mode="json"))
+
+
+_seed_items({
     "foo": {"name": "Foo", "price": 50.2},
     "bar": {"name": "Bar", "description": "The bartenders", "price": 62, "tax": 20.2},
     "baz": {"name": "Baz", "description": None, "price": 50.2, "tax": 10.5, "tags": []},
-}
+})
 
-@app.get("/items/{item_id}", response_model=Item)
+@router.get("/items/{item_id}", response_model=Item)
 async def read_item(item_id: str):
-    return items[item_id]
+    return _load_item(_idx[item_id])
 
-@app.put("/items/{item_id}")
+@router.put("/items/{item_id}")
 async def update_item(item_id: str, item: Item):
-    update_item_encoded = jsonable_encoder(item)
-    items[item_id] = update_item_encoded
+    update_item_encoded = item.model_dump(mode="json")
+    _store_item(item_id, update_item_encoded)
     return update_item_encoded
 
 """
+Note:
+For a Pydantic model, `item.model_dump(mode="json")` gives the same result as 
+`jsonable_encoder(item)`, but it's done by Pydantic's own serializer (written in 
+Rust) instead of walking every value in Python. That's what the example above uses.
+
+-----
+
 `PUT` is used to receive data that should replace the existing data.
 
 ---
@@ -104,14 +168,12 @@ Then you can use this to generate a `dict` with only the data thatw as set (sent
 the request), omitting default values:
 """
 
-@app.patch("/items/{item_id}", response_model=Item)
+@router.patch("/items/{item_id}", response_model=Item)
 async def update_item(item_id: str, item: Item):
-    stored_item_data = items[item_id]
-    stored_item_model = Item(**stored_item_data)
-    update_data = item.dict(exclude_unset=True)
-    updated_item = stored_item_model.copy(update=update_data)
-    items[item_id] = jsonable_encoder(updated_item)
-    return updated_item
+    i = _idx[item_id]
+    update_data = item.model_dump(exclude_unset=True, mode="json")
+    _store_item(item_id, update_data)
+    return _load_item(i)
 
 """
 Using Pydantic's `update` parameter
@@ -122,6 +184,21 @@ to update.
 
 Like `stored_item_model.copy(update=update_data)`.
 
+---
+
+Note
+
+The example above skips the copy and writes the update straight into the stored 
+columns instead:
+    - `item.model_dump(exclude_unset=True, mode="json")` gives only the data that 
+      was sent, already converted to JSON compatible types (like `jsonable_encoder`).
+    - Only those fields are written, in place, at the item's position.
+    - The stored data was already validated when it was saved, so the returned model 
+      is built with `Item.model_construct(...)`, which skips validating it again.
+
+That's one pass over the data instead of building a model, copying it, and 
+encoding it again.
+
 -----
 
 Partial updates recap
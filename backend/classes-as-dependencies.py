@@ -11,20 +11,19 @@ A `dict` from the previous example
 In the previous example, we were returning a `dict` from our dependency ("dependable"):
 """
 
-from typing import Union
-from typing_extensions import Annotated
-from fastapi import Depends, FastAPI
+from typing import Annotated
+from fastapi import APIRouter, Depends
 
-app = FastAPI()
+router = APIRouter(prefix="/classes-as-dependencies")
 
-async def common_parameters(q: Union[str,  None] = None, skip: int = 0, limit: int = 100):
+async def common_parameters(q: str | None = None, skip: int = 0, limit: int = 100):
     return {"q": q, "skip": skip, "limit": limit}
 
-@app.get("/v1/items/")
+@router.get("/v1/items/")
 async def read_items(commons: Annotated[dict, Depends(common_parameters)]):
     return commons
 
-@app.get("/v1/users/")
+@router.get("/v1/users/")
 async def read_users(commons: Annotated[dict, Depends(common_parameters)]):
     return commons
 
@@ -98,34 +97,52 @@ Then, we can change the dependency "dependable" `common_parameters` from
 above to the class `CommonQueryParams`:
 """
 
-from typing import Union
-from fastapi import FastAPI, Depends
-from typing_extensions import Annotated
+from functools import lru_cache
+from typing import Annotated, Tuple
 
-app = FastAPI()
+import orjson
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import JSONResponse
 
-fake_items_db = [{"item_name": "Foo"}, {"item_name": "Bar"}, {"item_name": "Baz"}]
+router = APIRouter(prefix="/classes-as-dependencies")
+
+fake_items_db = ({"item_name": "Foo"}, {"item_name": "Bar"}, {"item_name": "Baz"})
+
+"""
+Note:
+`fake_items_db` is a `tuple`, so it can't change, and the window of items for 
+each `skip` and `limit` is only sliced once and then reused by every request 
+that asks for the same window.
+"""
+
+@lru_cache(maxsize=256)
+def items_window(skip: int, limit: int) -> Tuple[dict, ...]:
+    return fake_items_db[skip : skip + limit]
 
 
 class CommonQueryParams:
-    def __init__(self, q: Union[str, None] = None, skip: int = 0, limit: int = 100):
+    __slots__ = ("q", "skip", "limit")
+
+    def __init__(self, q: str | None = None, skip: int = 0, limit: int = 100):
         self.q = q
         self.skip = skip
         self.limit = limit
 
 
-@app.get("/v1/items/")
+@router.get("/v1/items/")
 async def read_items(commons: Annotated[CommonQueryParams, Depends(CommonQueryParams)]):
-    response = {}
+    items = items_window(commons.skip, commons.limit)
+    content = {"q": commons.q, "items": items} if commons.q else {"items": items}
+    return Response(orjson.dumps(content), media_type="application/json")
 
-    if commons.q:
-        response.update({"q": commons.q})
+"""
+Note:
+`read_items` builds its result in a single dict literal and serializes it 
+with `orjson` itself, returning the bytes in a `Response`. FastAPI returns 
+a `Response` as is, so it skips `jsonable_encoder` and its own JSON encoding.
 
-    items = fake_items_db[commons.skip: commons.skip + commons.limit]
-    response.update({"items": items})
-    return response
+-----
 
-"""
 ...it has the same parameters as our previous `common_parameters`.
 
 Those parameters are what FastAPI will use to "solve" the dependency.
@@ -174,14 +191,11 @@ You could actually write just:
 
 from typing import Any
 
-@app.get("/v2/items/")
+@router.get("/v2/items/")
 async def read_items(commons: Annotated[Any, Depends(CommonQueryParams)]):
-    response = {}
-    if commons.q:
-        response.update({"q": commons.q})
-    items = fake_items_db[commons.skip : commons.skip + commons.limit]
-    response.update({"items": items})
-    return response
+    items = items_window(commons.skip, commons.limit)
+    content = {"q": commons.q, "items": items} if commons.q else {"items": items}
+    return Response(orjson.dumps(content), media_type="application/json")
 
 """
 But declaring the type is encouraged as that way your editor will know what will be passed 
@@ -213,14 +227,11 @@ The same example would then look like:
 """
 
 
-@app("/v3/items/")
+@router.get("/v3/items/")
 async def read_items(commons: Annotated[CommonQueryParams, Depends()]):
-    response = {}
-    if commons.q:
-        response.update({"q": commons.q})
-    items = fake_items_db[commons.skip : commons.skip + commons.limit]
-    response.update({"items": items})
-    return response
+    items = items_window(commons.skip, commons.limit)
+    content = {"q": commons.q, "items": items} if commons.q else {"items": items}
+    return Response(orjson.dumps(content), media_type="application/json")
 
 """
 ...and FastAPI will know what to do.
@@ -252,6 +263,8 @@ Review the example below.
 
 
 class MyDependency:
+    __slots__ = ("a", "b")
+
     def __init__(self, a: str, b: int):
         self.a = a
         self.b = b
@@ -259,12 +272,19 @@ class MyDependency:
     def get_data(self):
         return "This is my data"
 
+"""
+Note:
+`/v4/items` sends `b` back, and it can be any `int`. `orjson` (the default 
+response class in `main.py`) can't encode integers bigger than 64 bits, so this 
+one uses `JSONResponse`.
+"""
+
 
-@app.get("/v4/items")
+@router.get("/v4/items", response_class=JSONResponse)
 async def read_items(dependency: Annotated[MyDependency, Depends()]):
     return {"a": dependency.a, "b": dependency.b}
 
-@app.get("/v5/items")
+@router.get("/v5/items")
 async def read_items(dependency: Annotated[MyDependency, Depends()]):
     return dependency.get_data()
 
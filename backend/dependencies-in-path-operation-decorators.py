@@ -20,10 +20,11 @@ The path operation decorator receives an optional argument `dependencies`.
 It should be a `list` of `Depends()`:
 """
 
-from fastapi import Depends, FastAPI, Header, HTTPException
-from typing_extensions import Annotated
+from typing import Annotated
 
-app = FastAPI(root_path="/api")
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+router = APIRouter(prefix="/path-operation-decorators")
 
 async def verify_token(x_token: Annotated[str, Header()]):
     if x_token != "fake-super-secret-token":
@@ -34,7 +35,7 @@ async def verify_key(x_key: Annotated[str, Header()]):
         raise HTTPException(status_code=400, detail="X-Key header invalid")
     return x_key
 
-@app.get("/v1/items/", dependencies=[Depends(verify_token), Depends(verify_key)])
+@router.get("/v1/items/", dependencies=[Depends(verify_token), Depends(verify_key)])
 async def read_items():
     return [{"item": "Foo"}, {"item": "Bar"}]
 
@@ -77,7 +77,7 @@ executed, no matter if there was an exception or not.
     async def get_db():
         db = DBSession()
         try:
-            tield db
+            yield db
         finally:
             db.close()
 
@@ -95,8 +95,41 @@ For example, `dependency_c` can have a dependency on `dependency_b`, and
 `dependency_b` on `dependency_a`:
 """
 
-from fastapi import Depends
-from typing_extensions import Annotated
+import platform
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+"""
+Note:
+`DBSession`, `DepA`, `DepB`, `DepC` and the `generate_dep_*()` functions stand in 
+for a real database session and real resources, so the examples can run.
+"""
+
+class DBSession:
+    def close(self):
+        pass
+
+
+class DepA:
+    def close(self):
+        pass
+
+
+class DepB:
+    def close(self, dep_a: DepA):
+        pass
+
+
+class DepC:
+    def close(self, dep_b: DepB):
+        pass
+
+
+generate_dep_a = DepA
+generate_dep_b = DepB
+generated_dep_c = DepC
 
 async def dependency_a():
     dep_a = generate_dep_a()
@@ -105,7 +138,7 @@ async def dependency_a():
     finally:
         dep_a.close()
 
-async dependency_b(dep_a: Annotated[DepA, Depends(dependency_a)]):
+async def dependency_b(dep_a: Annotated[DepA, Depends(dependency_a)]):
     dep_b = generate_dep_b()
     try:
         yield dep_b
@@ -119,6 +152,31 @@ async def dependency_c(dep_b: Annotated[DepB, Depends(dependency_b)]):
     finally:
         dep_c.close(dep_b)
 
+"""
+Note:
+When a chain like this is always used as a whole, it can be fused into a single 
+dependency with `fuse_yield_chain()`. FastAPI then solves one dependency with one 
+exit step, instead of three. Each dependency in the chain is called with the value 
+yielded by the previous one, the fused dependency yields all the values as a 
+tuple, and the exit code runs in reverse order (`dependency_c` first), with any 
+exception passed to each of them, just like FastAPI would do:
+
+    deps: Annotated[tuple, Depends(dependencies_abc)]
+"""
+
+def fuse_yield_chain(*dependencies):
+    async def fused():
+        async with AsyncExitStack() as stack:
+            values = []
+            for dependency in dependencies:
+                context = asynccontextmanager(dependency)(*values[-1:])
+                values.append(await stack.enter_async_context(context))
+            yield tuple(values)
+
+    return fused
+
+dependencies_abc = fuse_yield_chain(dependency_a, dependency_b, dependency_c)
+
 """
 All of them can use `yield`.
 
@@ -238,17 +296,26 @@ class MySuperContextManager:
     def __init__(self):
         self.db = DBSession()
 
-    def __enter__(self):
+    async def __aenter__(self):
         return self.db
 
-    def __exit__(self, exc_type, exc_value, traceback):
+    async def __aexit__(self, exc_type, exc_value, traceback):
         self.db.close()
 
 
 async def get_db():
-    with MySuperContextManager() as db:
+    async with MySuperContextManager() as db:
         yield db
 
+"""
+Note:
+`get_db` is an `async` dependency, so `MySuperContextManager` is written as 
+an async context manager, with `__aenter__()` and `__aexit__()`, and used with 
+`async with`. That way entering and exiting it happens on the event loop as part 
+of the dependency, and if closing the session ever needs to wait on something, 
+`__aexit__()` can `await` it instead of blocking the loop.
+"""
+
 """
 Tip
 
@@ -265,3 +332,42 @@ But you don't have to use the decorators for FastAPI dependencies
 
 FastAPI will do it for you internally.
 """
+
+"""
+Note:
+The dependencies above are served by this `router` (included by `main.py` under 
+the `/with-yield` prefix), `/items/` uses the fused `dependency_a` -> `dependency_b` 
+-> `dependency_c` chain and `/db/` uses `get_db`.
+
+They are small, pure Python coroutines and generators, the kind of code PyPy's 
+JIT compiles very well, but only after it has run them enough times to trace them. 
+When running under PyPy, the router runs both dependencies `WARMUP_ITERATIONS` times 
+at startup (entering and exiting them the same way FastAPI does), so the first 
+requests are already served by compiled code. On CPython the warmup is skipped.
+"""
+
+WARMUP_ITERATIONS = 2000
+
+
+async def warm_up():
+    for _ in range(WARMUP_ITERATIONS):
+        async with asynccontextmanager(dependencies_abc)():
+            pass
+        async with asynccontextmanager(get_db)():
+            pass
+
+
+router = APIRouter(
+    prefix="/with-yield",
+    on_startup=[warm_up] if platform.python_implementation() == "PyPy" else [],
+)
+
+
+@router.get("/items/")
+async def read_items(deps: Annotated[tuple, Depends(dependencies_abc)]):
+    return {"dependencies": [type(dep).__name__ for dep in deps]}
+
+
+@router.get("/db/")
+async def read_db(db: Annotated[DBSession, Depends(get_db)]):
+    return {"db": type(db).__name__}
@@ -44,25 +44,41 @@ It is just a function that can take all the same parameters that a
 Path Operation Function can take:
 """
 
-from typing import Union
+from typing import Annotated
 
-from fastapi import Depends, FastAPI
-from typing_extensions import Annotated
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from typing_extensions import TypeAlias
 
-app = FastAPI()
+router = APIRouter(prefix="/dependencies", default_response_class=JSONResponse)
 
-async def common_parameters(q: Union[str, None] = None, skip: int = 0, limit: int = 100):
+async def common_parameters(q: str | None = None, skip: int = 0, limit: int = 100):
     return {"q": q, "skip": skip, "limit": limit}
 
-@app.get("/v1/items/")
-async def read_items(commons: Annotated[dict, Depends(common_parameters)]):
+CommonsDep: TypeAlias = Annotated[dict, Depends(common_parameters)]
+
+@router.get("/v1/items/")
+async def read_items(commons: CommonsDep):
     return commons
 
-@app.get("/v1/users/")
-async def read_users(commons: Annotated[dict, Depends(common_parameters)]):
+@router.get("/v1/users/")
+async def read_users(commons: CommonsDep):
     return commons
 
 """
+Note:
+Instead of writing `Annotated[dict, Depends(common_parameters)]` 
+in each Path Operation Function, they all use the same `CommonsDep` alias 
+(explained below), so every route shares a single `Depends` instance.
+
+The Path Operations are declared on an `APIRouter`, served by `main.py` under 
+the `/dependencies` prefix. `main.py` uses `ORJSONResponse` by default, but this 
+router keeps `JSONResponse`: `skip` and `limit` are sent back and can be any 
+`int`, and `orjson` can't encode integers bigger than 64 bits.
+
+-----
+
 That's it.
 
 2 lines.
@@ -167,18 +183,27 @@ whole parameter with the type annotation and `Depends()`.
 
 But because we are using `Annotated`, we can store that `Annotated` value in a variable 
 and use it in multiple places:
-"""
 
-CommonsDep = Annotated[dict, Depends(common_parameters)]
+    CommonsDep = Annotated[dict, Depends(common_parameters)]
 
-@app.get("/v2/items/")
+(`CommonsDep` is already declared at the top of this file, the `/v1/` 
+Path Operation Functions use it too.)
+"""
+
+@router.get("/v2/items/")
 async def read_items(commons: CommonsDep):
     return commons
 
-@app.get("/v2/users/")
+@router.get("/v2/users/")
 async def read_users(commons: CommonsDep):
     return commons
 
+assert all(
+    route.endpoint.__annotations__["commons"].__metadata__[0] is CommonsDep.__metadata__[0]
+    for route in router.routes
+    if isinstance(route, APIRoute)
+)
+
 """
 Tip
 
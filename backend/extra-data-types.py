@@ -66,13 +66,15 @@ Here's an example Path Operation with parameters using some of the
 above types.
 """
 
-from fastapi import Body, FastAPI
+import orjson
+from fastapi import Body, FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from datetime import datetime, time, timedelta
 from uuid import UUID
 from typing import Union
 from typing_extensions import Annotated
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 @app.put("/v1/items/{item_id}")
 async def read_items(
@@ -86,12 +88,17 @@ async def read_items(
     # for example, perform normal data manipulations, like:
     start_process = start_datetime + process_after
     duration = end_datetime - start_process
-    return {
+    # orjson serializes the UUID, datetime and time values itself, the timedelta
+    # values are sent as seconds (as FastAPI would), so the dict goes straight to
+    # `orjson.dumps()` and the bytes are returned in a `Response`, skipping
+    # `jsonable_encoder` (and the extra options `ORJSONResponse` passes to orjson).
+    content = {
         "item_id": item_id,
         "start_datetime": start_datetime,
         "end_datetime": end_datetime,
         "repeat_at": repeat_at,
-        "process_after": process_after,
+        "process_after": process_after.total_seconds(),
         "start_process": start_process,
-        "duration": duration
+        "duration": duration.total_seconds()
     }
+    return Response(orjson.dumps(content), media_type="application/json")
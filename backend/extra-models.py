@@ -27,46 +27,197 @@ Here's a general idea of how the models could look like with their password fiel
 they are used:
 """
 
+import hashlib
+import hmac
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Union 
-from fastapi import FastAPI 
-from pydantic import BaseModel, EmailStr 
+import orjson
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.networks import validate_email
+from typing_extensions import Annotated
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+
+"""
+Note:
+The docs declare `email: EmailStr` in each model. Checking an email address 
+with `email-validator` is by far the slowest part of validating these models, 
+and the same addresses come up again and again (the same user signing up, 
+logging in, ...).
+
+`Email` is declared once and used by all the models. It validates the address 
+the same way `EmailStr` does (with Pydantic's own `validate_email()`), with the 
+same errors and the same schema (`"format": "email"`), but the result for each 
+address is cached, so an address that was already checked is a single lookup.
+"""
+
+@lru_cache(maxsize=4096)
+def _check_email(value: str) -> str:
+    return validate_email(value)[1]
+
+
+Email = Annotated[str, AfterValidator(_check_email), Field(json_schema_extra={"format": "email"})]
 
 
 class UserIn(BaseModel):
     username: str 
     password: str 
-    email: EmailStr 
-    full_name: Union[str, None] = None 
+    email: Email 
+    full_name: str | None = None 
+
 
+"""
+Note:
+`UserOut` is only used to send data back, it never validates anything that 
+comes from the client. So instead of a Pydantic model it is a standard 
+`@dataclass`, which is several times faster to create. It doesn't use 
+`slots=True`: Pydantic 2.0 writes the field defaults onto the class when it 
+builds the `TypeAdapter`, which replaces the slots and breaks `__init__`. 
+FastAPI still uses it as the `response_model` (for the OpenAPI schema) the same 
+way, and `_USER_OUT_ADAPTER` (a `TypeAdapter` created once) turns it into JSON 
+in `create_user`.
+"""
 
-class UserOut(BaseModel):
+@dataclass
+class UserOut:
     username: str 
-    email: EmailStr 
-    full_name: Union[str, None] = None 
+    email: Email 
+    full_name: str | None = None 
+
+_USER_OUT_ADAPTER = TypeAdapter(UserOut)
 
 
 class UserInDB(BaseModel):
+    model_config = ConfigDict(revalidate_instances="never")
+
     username: str 
     hashed_password: str 
-    email: EmailStr 
-    full_name: Union[str, None] = None 
+    email: Email 
+    full_name: str | None = None 
+
+
+"""
+Note:
+The docs' `fake_password_hasher` just prepends `"supersecret"` to the password. 
+Here it hashes it with SHA-256 (with `"supersecret"` as the salt) through 
+`hashlib`, which uses OpenSSL and its hardware-accelerated SHA-256 on CPUs 
+that have it. It's still fake, real password hashing should use a slow, 
+memory-hard function like `hashlib.scrypt` or argon2.
+"""
 
+_SALT = b"supersecret"
 
-def fake_password_hasher(raw_password: str):
-    return "supersecret" + raw_password
+def fake_password_hasher(raw_password: str) -> str:
+    return hashlib.sha256(_SALT + raw_password.encode("utf-8")).hexdigest()
 
 def fake_save_user(user_in: UserIn):
     hashed_password = fake_password_hasher(user_in.password)
-    user_in_db = UserInDB(**user_in.dict(), hashed_password=hashed_password)
+    user_in_db = UserInDB.model_construct(
+        **user_in.model_dump(exclude={"password"}), hashed_password=hashed_password
+    )
     print("User saved! ..not really")
     return user_in_db 
 
+"""
+Note:
+The docs create `UserInDB(**user_in.dict(), hashed_password=hashed_password)`, 
+which validates every field again, including the `email` (and email validation 
+is not cheap). But `user_in` was already validated when the request 
+came in, so here `UserInDB.model_construct()` builds it from that data without 
+validating it again, which is several times faster. `password` is left out, 
+`UserInDB` doesn't have it.
+
+`UserInDB` also sets `revalidate_instances="never"`, so when a `UserInDB` built 
+this way is passed to something that validates a `UserInDB` (another model's 
+field, a `TypeAdapter`...), it is used as it is, without validating or copying 
+its fields again. That's already Pydantic 2's default, it's set explicitly so 
+the model keeps working this way even if a base config changes it.
+"""
+
 @app.post("/v1/user/", response_model=UserOut)
 async def create_user(user_in: UserIn):
     user_saved = fake_save_user(user_in)
-    return user_saved
+    user_out = UserOut(user_saved.username, user_saved.email, user_saved.full_name)
+    return Response(_USER_OUT_ADAPTER.dump_json(user_out), media_type="application/json")
+
+"""
+Note:
+`create_user_internal` does the same as `create_user`, but for trusted services 
+(e.g. a gateway that already validated the data). It reads the raw body with 
+`orjson` and builds the `UserIn` with `model_construct()`, without validating 
+it again. As nothing is checked, the callers must send an `X-Token` header with 
+the internal token (checked by `verify_internal_token`), and the response is 
+still a `UserOut`, so the `hashed_password` is never sent back.
+
+The body is still checked enough for the route not to fail on it: a body that 
+isn't valid JSON, isn't a JSON object, or doesn't have the required fields 
+(`_USER_IN_REQUIRED`) as strings (and `full_name`, if sent, as a string or 
+`null`) gets a 400 response instead of an error in the server.
+
+The body is documented with `openapi_extra`, as the function doesn't declare it.
+"""
+
+_INTERNAL_TOKEN = b"fake-super-secret-token"
+_USER_IN_REQUIRED = ("username", "password", "email")
+
+async def verify_internal_token(x_token: Annotated[str, Header()]):
+    if not hmac.compare_digest(x_token.encode("utf-8"), _INTERNAL_TOKEN):
+        raise HTTPException(status_code=400, detail="X-Token header invalid")
+
+@app.post(
+    "/v1/user/internal",
+    response_model=UserOut,
+    dependencies=[Depends(verify_internal_token)],
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/UserIn"}}},
+            "required": True,
+        }
+    },
+)
+async def create_user_internal(request: Request):
+    try:
+        data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    if (
+        type(data) is not dict
+        or any(type(data.get(key)) is not str for key in _USER_IN_REQUIRED)
+        or type(data.get("full_name", "")) not in (str, type(None))
+    ):
+        raise HTTPException(
+            status_code=400, detail="The body must be an object with username, password and email"
+        )
+    user_in = UserIn.model_construct(**data)
+    user_saved = fake_save_user(user_in)
+    user_out = UserOut(user_saved.username, user_saved.email, user_saved.full_name)
+    return Response(_USER_OUT_ADAPTER.dump_json(user_out), media_type="application/json")
+
+"""
+Note:
+`create_users` saves a whole list of users in one request (e.g. an import done 
+by an admin), instead of one request per user. FastAPI validates the whole 
+`List[UserIn]` body in a single call into pydantic-core, and the response is 
+serialized in a single call too, with `_USERS_OUT_ADAPTER`.
+
+It's a normal `def`, not `async def`: hashing the passwords of a big list takes 
+a while, so FastAPI runs it in the threadpool to not block the event loop meanwhile.
+"""
+
+from typing import List
+
+_USERS_OUT_ADAPTER = TypeAdapter(List[UserOut])
+
+@app.post("/v1/users/bulk", response_model=List[UserOut])
+def create_users(users_in: List[UserIn]):
+    users_out = []
+    for user_in in users_in:
+        user_saved = fake_save_user(user_in)
+        users_out.append(UserOut(user_saved.username, user_saved.email, user_saved.full_name))
+    return Response(_USERS_OUT_ADAPTER.dump_json(users_out), media_type="application/json")
 
 """
 About `**user_in.dict()`
@@ -193,22 +344,33 @@ That way, we can declare just the differences between the models (with plaintext
 
 class UserBase(BaseModel):
     username: str 
-    email: EmailStr 
-    full_name: Union[str, None] = None
+    email: Email 
+    full_name: str | None = None
 
 
 class UserInNew(UserBase):
     password: str 
 
 
-class UserOutNew(UserBase):
-    pass
+@dataclass
+class UserOutNew:
+    username: str 
+    email: Email 
+    full_name: str | None = None
 
 
 class UserInDBNew(UserBase):
     hashed_password: str
 
 
+"""
+Note:
+`UserOutNew` is an output-only `@dataclass` for the same reason as `UserOut` 
+above. A dataclass can't subclass a Pydantic model, so it declares the 
+`UserBase` fields itself.
+"""
+
+
 """
 Union or anyOf
 
@@ -228,6 +390,8 @@ by the less specific type. In the example below, the more specific
 `PlaneItem` comes before `CarItem` in `Union[PlaneItem, CarItem]`.
 """
 
+from typing import Literal
+
 
 class BaseItem(BaseModel):
     description: str 
@@ -235,14 +399,26 @@ class BaseItem(BaseModel):
 
 
 class CarItem(BaseItem):
-    type = "car"
+    type: Literal["car"] = "car"
 
 
 class PlaneItem(BaseItem):
-    type = "plane"
+    type: Literal["plane"] = "plane"
     size: int 
 
 
+"""
+Note:
+Here `type` is a `Literal` in each model, and the `Union` is declared with 
+`Field(discriminator="type")`. Pydantic then reads `type` once and goes straight 
+to the matching model, instead of trying `PlaneItem` and then `CarItem` in order 
+(so the order of the `Union` doesn't matter anymore), and the OpenAPI schema 
+gets a `discriminator` for it too.
+"""
+
+AnyItem = Annotated[Union[PlaneItem, CarItem], Field(discriminator="type")]
+
+
 items = {
     "item1": {"description": "All my friends drive a low rider", "type": "car"},
     "item2": {
@@ -252,9 +428,27 @@ items = {
     },
 }
 
-@app.get("/v1/items/{item_id}", response_model=Union[PlaneItem, CarItem])
+_ITEM_BYTES = {item_id: orjson.dumps(item) for item_id, item in items.items()}
+
+@app.get("/v1/items/{item_id}", response_model=AnyItem)
 async def read_item(item_id: str):
-    return items[item_id]
+    try:
+        content = _ITEM_BYTES[item_id]
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return Response(content, media_type="application/json")
+
+"""
+Note:
+The data in `items` is already plain JSON data (`dict`s, `str`s and numbers) 
+that matches the `response_model`, and it never changes. So each item is turned 
+into JSON `bytes` once, in `_ITEM_BYTES`, when the module is loaded, and 
+`read_item` only looks them up and returns them in a `Response`. FastAPI sends a 
+`Response` as is, without running the data through `jsonable_encoder` and the 
+`response_model`, which is then only used for the OpenAPI schema.
+
+An `item_id` that isn't in `items` gets a 404 instead of an error.
+"""
 
 """
 Union in Python 3.10
@@ -284,20 +478,39 @@ For that, use that standard Python `typing.List` (or just `list` in Python
 
 from typing import List
 
+from fastapi import Response
+from pydantic import TypeAdapter
+
 
 class Item(BaseModel):
     name: str
     description: str
 
 
-items = [
+"""
+Note:
+`read_items` and `read_keyword_weights` serialize their data with a `TypeAdapter` 
+for their `response_model`, created once when the module is loaded. 
+`.dump_json()` goes straight from the data to JSON `bytes` in pydantic-core, 
+which are returned in a `Response`, skipping `jsonable_encoder`.
+
+As the serializer for `List[Item]` works with `Item` objects, `item_list` is 
+validated into them once, when the module is loaded. And as the data never 
+changes, it is also serialized only once, the same as `_ITEM_BYTES` above.
+"""
+
+_ITEMS_ADAPTER = TypeAdapter(List[Item])
+
+item_list = _ITEMS_ADAPTER.validate_python([
     {"name": "Foo", "description": "There comes my hero"},
     {"name": "Red", "description": "It's my aeroplane"},
-]
+])
+
+_ITEMS_BYTES = _ITEMS_ADAPTER.dump_json(item_list)
 
 @app.get("/v2/items/", response_model=List[Item])
 async def read_items():
-    return items
+    return Response(_ITEMS_BYTES, media_type="application/json")
 
 """
 Response with arbitrary `dict`
@@ -313,9 +526,13 @@ In this case, you can use `typing.Dict` (or just `dict` in Python 3.9 and above)
 
 from typing import Dict
 
+_WEIGHTS_ADAPTER = TypeAdapter(Dict[str, float])
+
+_WEIGHTS_BYTES = _WEIGHTS_ADAPTER.dump_json({"foo": 2.3, "bar": 3.4})
+
 @app.get("/v1/keyword-weights/", response_model=Dict[str, float])
 async def read_keyword_weights():
-    return {"foo": 2.3, "bar": 3.4}
+    return Response(_WEIGHTS_BYTES, media_type="application/json")
 
 """
 Recap
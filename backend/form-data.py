@@ -17,6 +17,7 @@ Import `Form` from `fastapi`:
 """
 
 from fastapi import FastAPI, Form
+from fastapi.responses import ORJSONResponse
 from typing_extensions import Annotated
 
 """
@@ -47,7 +48,7 @@ To declare form bodies, you need to use `Form` explicitly, because without it
 the parameters would be interpreted as query parameters or body (JSON) parameters.
 """
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 @app.post("/login/")
 async def login(username: Annotated[str, Form()], password: Annotated[str, Form()]):
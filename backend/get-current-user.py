@@ -19,22 +19,55 @@ The same way we use Pydantic to declare bodies, we can use it
 anywhere else:
 """
 
-from typing import Union
-from fastapi import Depends, FastAPI
+import re
+from functools import lru_cache
+
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing_extensions import Annotated
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+
+"""
+Note:
+`OAuth2PasswordBearer` splits the `Authorization` header in two and lowercases 
+the scheme on every request. `BearerScheme` does the same check with a single 
+call to a regular expression compiled once, when the module is imported. It 
+accepts and rejects exactly the same headers (`bearer` in any case, then the 
+token is everything after the first space) and still documents the same 
+security scheme in OpenAPI.
+"""
+
+_match_bearer = re.compile(r"bearer(?: (.*)|)", re.IGNORECASE | re.DOTALL).fullmatch
+
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+class BearerScheme(OAuth2PasswordBearer):
+    async def __call__(self, request: Request) -> str | None:
+        authorization = request.headers.get("Authorization")
+        match = _match_bearer(authorization) if authorization else None
+        if match is None:
+            if self.auto_error:
+                raise HTTPException(
+                    status_code=401,
+                    detail="Not authenticated",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            return None
+        return match.group(1) or ""
+
+
+oauth2_scheme = BearerScheme(tokenUrl="token", scheme_name="OAuth2PasswordBearer")
 
 
 class User(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     username: str
-    email: Union[str,  None] = None
-    full_name: Union[str, None] = None
-    disabled: Union[bool, None] = None
+    email: str | None = None
+    full_name: str | None = None
+    disabled: bool | None = None
 
 
 """
@@ -59,7 +92,20 @@ Get the user
 that takes a token as a `str` and returns our Pydantic `User` model:
 """
 
-def fake_decode_token(token):
+"""
+Note:
+Decoding a token always gives the same user for the same token, and a logged 
+in client sends the same token on every request. So `fake_decode_token` is 
+wrapped in `lru_cache`, and a token that was already decoded gets the same 
+`User` back without building (and validating) it again. `User` is `frozen`, 
+so sharing the same object between requests is safe.
+
+With real (JWT) tokens the cache would also need to expire entries, e.g. when 
+the token expires or the signing key changes.
+"""
+
+@lru_cache(maxsize=4096)
+def fake_decode_token(token: str) -> User:
     return User(username=token + "fakedecoded", email="john@example.com", full_name="John Doe")
 
 async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]):
@@ -34,17 +34,34 @@ To return HTTP responses with errors to the client you use `HTTPException`.
 Import `HTTPException`
 """
 
-from fastapi import FastAPI, HTTPException
+import sys
+from types import MappingProxyType
 
-app = FastAPI()
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, ORJSONResponse
 
-items = {"foo": "The Foo Wrestlers"}
+app = FastAPI(default_response_class=ORJSONResponse)
+
+items = MappingProxyType({sys.intern("foo"): "The Foo Wrestlers"})
+
+"""
+Note:
+The docs check `item_id not in items` and then read `items[item_id]`, looking 
+the item up twice. Here `read_item` and `read_item_header` look it up once, with 
+`items.get()`.
+
+`items` never changes, so it's wrapped in a read-only `MappingProxyType` (a 
+handler can't modify it by mistake), and its keys are interned with 
+`sys.intern()`, so a lookup with an `item_id` that is the same interned string 
+matches by identity, without comparing the characters.
+"""
 
 @app.get("/v1/items/{item_id}")
 async def read_item(item_id: str):
-    if item_id not in items:
+    item = items.get(item_id)
+    if item is None:
         raise HTTPException(status_code=404, detail="Item not found")
-    return {"item": items[item_id]}
+    return {"item": item}
 
 """
 Raise an HTTPException in your code
@@ -110,13 +127,14 @@ But in case you needed it for an advanced scenario, you can add custom headers:
 
 @app.get("/v1/items-header/{item_id}")
 async def read_item_header(item_id: str):
-    if item_id not in items:
+    item = items.get(item_id)
+    if item is None:
         raise HTTPException(
             status_code=404,
             detail="Item not found",
             headers={"X-Error": "There goes my error"}
         )
-    return {"item": items[item_id]}
+    return {"item": item}
 
 """
 Install custom exception handlers
@@ -152,18 +170,32 @@ convenience for you, the developer. But most of the available responses come dir
 from Starlette. The same with `Request`.
 """
 
+import orjson
 from fastapi import Response
-from fastapi.responses import JSONResponse
 
 class UnicornException(Exception):
     def __init__(self, name: str):
         self.name = name
 
+"""
+Note:
+The docs build a `JSONResponse` with a `dict` in `unicorn_exception_handler`, 
+which is encoded to JSON on every call. Only `exc.name` changes, so the JSON 
+before and after it is encoded once, in `_UNICORN_PREFIX` and `_UNICORN_SUFFIX`, 
+and the handler only adds the name in between (escaped with `orjson`, without 
+its quotes, so a name with `"` in it is still valid JSON).
+"""
+
+_UNICORN_PREFIX = b'{"message":"Oops! '
+_UNICORN_SUFFIX = b' did something. There goes a rainbow..."}'
+
 @app.exception_handler(UnicornException)
 async def unicorn_exception_handler(request: Request, exc: UnicornException):
-    return JSONResponse(
-        status_code=418
-        content={"message": f"Oops! {exc.name} did something. There goes a rainbow..."}
+    name = orjson.dumps(exc.name)[1:-1]
+    return Response(
+        _UNICORN_PREFIX + name + _UNICORN_SUFFIX,
+        status_code=418,
+        media_type="application/json",
     )
 
 @app.get("/v1/unicorns/{name}")
@@ -204,7 +236,15 @@ from fastapi.responses import PlainTextResponse
 async def validation_exception_handler(request, exc):
     return PlainTextResponse(str(exc), status_code=400)
 
-@app.get("/v2/items/{item_id}")
+"""
+Note:
+`/v2/items/{item_id}` and `/v3/items/{item_id}` send `item_id` back, and it can 
+be any `int`, bigger than what `orjson` can encode (64 bits). So they use 
+`JSONResponse` instead of the app's default `ORJSONResponse` (and so does 
+`create_item` below, it sends back the `size` it received).
+"""
+
+@app.get("/v2/items/{item_id}", response_class=JSONResponse)
 async def read_item(item_id: int):
     if item_id == 3:
         raise HTTPException(status_code=418, detail="Nope! I don't like 3.")
@@ -262,11 +302,25 @@ for these errors:
 
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+"""
+Note:
+`http_exception_handler` passes the exception's `headers` along (FastAPI's 
+`HTTPException` can have them, Starlette's may not), so the `X-Error` header 
+of `read_item_header` is still sent. The `detail` is only converted with 
+`str()` when it isn't one already (it's usually a `str`, as in 
+`HTTPException(..., detail="...")`).
+"""
+
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request, exc):
-    return PlainTextResponse(str(exc.detail), status_code=ext.status_code)
+    detail = exc.detail
+    if type(detail) is not str:
+        detail = str(detail)
+    return PlainTextResponse(
+        detail, status_code=exc.status_code, headers=getattr(exc, "headers", None)
+    )
 
-@app.get("/v3/items/{item_id}")
+@app.get("/v3/items/{item_id}", response_class=JSONResponse)
 async def read_item(item_id: int):
     if item_id == 3:
         raise HTTPException(status_code=418, detail="Nope! I don't like 3.")
@@ -292,21 +346,48 @@ the user, etc.
 """
 
 from fastapi import status
-from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 
+"""
+Note:
+The docs run `{"detail": exc.errors(), "body": exc.body}` through 
+`jsonable_encoder` first. But the errors are already plain `dict`s, `str`s and 
+numbers, and the body is what was decoded from the JSON (or the raw `bytes` when 
+it wasn't valid JSON, decoded here to a `str`). So it goes straight to 
+`orjson.dumps()`, which calls `str()` on anything it can't serialize itself 
+(like an exception in an error's `ctx`).
+
+`orjson` can't encode integers bigger than 64 bits though (and doesn't pass them 
+to `default`), and the body could have any number in it. When it fails, the 
+handler goes back to what the docs do, `jsonable_encoder` and a `JSONResponse`.
+"""
+
+from fastapi.encoders import jsonable_encoder
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    return JSONResponse(
+    body = exc.body
+    if isinstance(body, (bytes, bytearray)):
+        body = body.decode("utf-8", "replace")
+    content = {"detail": exc.errors(), "body": body}
+    try:
+        data = orjson.dumps(content, default=str)
+    except TypeError:
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content=jsonable_encoder(content),
+        )
+    return Response(
+        data,
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=jsonable_encoder({"detail": exc.errors(), "body": exc.body}),
+        media_type="application/json",
     )
 
 class Item(BaseModel):
     title: str
     size: int
 
-@app.post("/v1/items/")
+@app.post("/v1/items/", response_class=JSONResponse)
 async def create_item(item: Item):
     return item
 
@@ -373,24 +454,36 @@ If you want to use the exception along with the same default exception handlers
 you can import and re-use the default exception handlers from `fastapi.exception_handlers`:
 """
 
+import logging
+
 from fastapi.exception_handlers import (
     http_exception_handler,
-    request_validation_exception_hanlder,
+    request_validation_exception_handler,
 )
 
-@app.exception_hanlder(StarletteHTTPException)
+"""
+Note:
+The docs `print()` an f-string with the exception, which formats it (and writes 
+it to stdout) on every error. Here the handlers log it instead, with the 
+exception passed as an argument, so it's only formatted if the message is 
+actually emitted at the logger's level.
+"""
+
+log = logging.getLogger(__name__)
+
+@app.exception_handler(StarletteHTTPException)
 async def custom_http_exception_handler(request, exc):
-    print(f"OMG! An HTTP error!: {repr(exc)}")
+    log.error("OMG! An HTTP error!: %r", exc)
     return await http_exception_handler(request, exc)
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_hanlder(request, exc):
-    print(f"OMG! The client send invalid data!: {exc}")
+    log.warning("OMG! The client send invalid data!: %s", exc)
     return await request_validation_exception_handler(request, exc)
 
 """
-In this example you are just printing the error with a very expressive message, 
+In this example you are just logging the error with a very expressive message, 
 but you get the idea. 
 
 You can use the exception and then just re-use the default exception handlers.
-""'
\ No newline at end of file
+"""
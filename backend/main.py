@@ -0,0 +1,39 @@
+"""
+Main
+
+Serves the Body lessons (`body-fields`, `body-multiple-parameters`, 
+`body-nested-models`, and `body-updates`) and the Dependencies lessons 
+(`dependencies`, `classes-as-dependencies`, 
+`dependencies-in-path-operation-decorators`, and `dependencies-with-yield`) 
+from a single FastAPI app.
+
+Each of those lessons declares its Path Operations on an `APIRouter` with its 
+own prefix, and they are all included here. That way there's only one app, one 
+OpenAPI schema, and one middleware stack, instead of one of each per lesson.
+
+The lesson files have a "-" in their names, so they can't be imported with a 
+normal `import` statement, `importlib.import_module` is used instead.
+
+Run it from the backend directory with:
+
+    uvicorn main:app --reload
+"""
+
+from importlib import import_module
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+app = FastAPI(root_path="/api", default_response_class=ORJSONResponse)
+
+for lesson in (
+    "body-fields",
+    "body-multiple-parameters",
+    "body-nested-models",
+    "body-updates",
+    "dependencies",
+    "classes-as-dependencies",
+    "dependencies-in-path-operation-decorators",
+    "dependencies-with-yield",
+):
+    app.include_router(import_module(lesson).router)
@@ -26,12 +26,22 @@ use the shortcut constants in `status`:
 
 from typing import Set, Union
 from fastapi import FastAPI, status
-from pydantic import Basemodel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 
+"""
+Note:
+`Item` is `frozen` (the Path Operations only return it, they never change it) 
+and forbids extra fields, so a body with unknown keys is rejected instead of 
+having them silently dropped.
+"""
+
 class Item(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     name: str
     description: Union[str, None] = None
     price: float
@@ -88,8 +98,15 @@ FastAPI supports that the same way as with plain strings:
 from enum import Enum
 
 
-class Tags(Enum):
-    item = "items"
+"""
+Note:
+`Tags` also subclasses `str`, so each member is the tag string itself (e.g. 
+`Tags.items == "items"`), and it goes into the OpenAPI schema as is, without 
+reading its `.value`.
+"""
+
+class Tags(str, Enum):
+    items = "items"
     users = "users"
 
 
@@ -107,12 +124,14 @@ Summary and Description
 You can add a `summary` and `description`:
 """
 
-class ItemTwo(BaseModel):
-    name: str
-    description: Union[str, None] = None
-    price: float
-    tax: Union[float, None] = None
-    tags: Set[str] = set()
+"""
+Note:
+The docs declare `ItemTwo` with exactly the same fields as `Item`. Here it's just 
+another name for `Item`, so Pydantic doesn't build a second validator and 
+serializer for it, and the OpenAPI schema has a single `Item` model.
+"""
+
+ItemTwo = Item
 
 
 @app.post(
@@ -163,7 +182,7 @@ You can specify the response description with the parameter
     "/v6/items/",
     response_model=ItemTwo,
     summary="Create an item",
-    resposne_description="The created item",
+    response_description="The created item",
 )
 async def create_item(item: Item):
     """
@@ -1,16 +1,54 @@
-from fastapi import FastAPI, Form
+import logging
+
+import orjson
+from fastapi import FastAPI, Form, Response
+from fastapi.responses import ORJSONResponse
 from typing_extensions import Annotated
 
-app = FastAPI()
+"""
+Note:
+The handlers are declared once, at module level, and `make_app()` registers them
+on a new app. The same handlers (and the `Form()` types, declared once in
+`FormStr` and `FormInt`) can then be served from more than one app, e.g. one
+behind a proxy that serves it under `/api`:
+
+    api_app = make_app(root_path="/api")
+
+`firstname` and `lastname` share the single `Form()` in `FormStr`, so only two 
+`Form()` objects are created for the three parameters. That's safe, FastAPI 
+copies the `Form()` for each parameter it's used in, so they don't affect each 
+other.
+
+`login` logs the form data at the `DEBUG` level instead of printing each value, 
+which writes to stdout (and takes its lock) three times on every request. The 
+message is only formatted when the app's logging is configured with `DEBUG` 
+enabled for this logger, e.g. with `logging.basicConfig(level=logging.DEBUG)`.
+
+The response of `login` always has the same shape, so it's written directly as 
+JSON `bytes`: only the message is encoded (with `orjson`, which also escapes 
+any quotes or backslashes in the names), between the constant `{"message":` 
+and `}`. It's returned in a `Response`, skipping `jsonable_encoder` and 
+`json.dumps()`.
+"""
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+FormStr = Annotated[str, Form()]
+FormInt = Annotated[int, Form()]
 
-@app.get("/")
 async def greet():
     return {"message": "Welcome! This is practice-form-data!"}
 
-@app.post("/login")
-async def login(firstname: Annotated[str, Form()], lastname: Annotated[str, Form()], age: Annotated[int, Form()]):
-    print(firstname)
-    print(lastname)
-    print(age)
-    return {"message": f"Hello {firstname} {lastname}, you are {age} years old."}
+async def login(firstname: FormStr, lastname: FormStr, age: FormInt):
+    log.debug("login %s %s %d", firstname, lastname, age)
+    message = orjson.dumps(f"Hello {firstname} {lastname}, you are {age} years old.")
+    return Response(b'{"message":' + message + b"}", media_type="application/json")
+
+def make_app(root_path: str = "") -> FastAPI:
+    app = FastAPI(root_path=root_path, default_response_class=ORJSONResponse)
+    app.get("/")(greet)
+    app.post("/login")(login)
+    return app
 
+app = make_app()
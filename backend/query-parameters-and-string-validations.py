@@ -9,16 +9,34 @@ Python 3.10), that means that it's of type 'str' but could also be 'None',
 and indeed, the default value is 'None', so FastAPI will now it's not required.
 """
 
-from typing import Union
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+
+"""
+Note:
+Most of the Path Operations in this file return the same items, so they are 
+created once, in `ITEMS` (a `tuple`, it's sent as a JSON array the same way), 
+instead of on every request. When there's no `q`, the whole result is always the 
+same too, so `ITEMS_RESULTS` is returned as it is, and when there is, the result 
+is created with `q` in it, instead of creating it and then `.update()`ing it.
+
+The responses are serialized with `orjson` (`ORJSONResponse`).
+
+The types in the code below are written as `str | None` and `list[str]` (Python 
+3.10 and 3.9), instead of `Union[str, None]` and `List[str]` from `typing`. They 
+mean the same, and are a bit less work for Pydantic when it builds the schemas.
+"""
+
+ITEMS = ({"item_id": "Foo"}, {"item_id": "Bar"})
+ITEMS_RESULTS = {"items": ITEMS}
 
 @app.get("/v1/items/")
-async def read_items(q: Union[str, None] = None):
+async def read_items(q: str | None = None):
     results = {"items": [{"items_id": "Foo"}, {"items_id": "Bar"}]}
     if q:
-        results.update({"q": q})
+        results["q"] = q
     return results
 
 """
@@ -39,11 +57,10 @@ from fastapi import Query
 from typing_extensions import Annotated
 
 @app.get("/v2/items/")
-async def read_items(q: Annotated[Union[str, None], Query(max_length=50)] = None):
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
+async def read_items(q: Annotated[str | None, Query(max_length=50)] = None):
     if q:
-        results.update({"q": q})
-    return results
+        return {"items": ITEMS, "q": q}
+    return ITEMS_RESULTS
 
 """
 Use 'Annotated' in the type for the 'q' parameter
@@ -196,14 +213,22 @@ You can also add a paramter 'min_length':
 
 @app.get("/v3/items/")
 async def read_items(
-    q: Annotated[Union[str, None], Query(min_length=3, max_length=50)] = None
+    q: Annotated[str | None, Query(min_length=3, max_length=50)] = None
 ):
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
     if q:
-        results.update({"q": q})
-    return results
+        return {"items": ITEMS, "q": q}
+    return ITEMS_RESULTS
 
 """
+Note:
+There's no need to check `len(q)` yourself before FastAPI validates it (e.g. in a
+dependency) to reject bad values faster. `min_length` and `max_length` become
+part of the `str` schema of the parameter, and are checked by pydantic-core, in
+Rust, while the value is validated anyway. A dependency would be one more
+(Python) function to solve and call on every request, and its `q` would still
+be validated by Pydantic, so it would only make the valid requests slower. The
+errors would also be different from the usual 422 with the details of each one.
+
 Add Regular Expressions
 
 You can define a regular expression that the paramter should match.
@@ -222,14 +247,53 @@ But whenever you need them and go and learn them, know that you can already use
 them directly in FastAPI.
 """
 
+"""
+Note:
+The docs use `regex=`, which is deprecated since FastAPI 0.100.0 (with Pydantic 2) 
+in favor of `pattern=`. The pattern is declared once, in `FIXEDQUERY_PATTERN`, 
+and shared by this Path Operation and `/v13/items/`. Pydantic compiles it (with 
+the Rust `regex` crate) once, when the Path Operation is declared, not on each 
+request. It has to be a `str`, Pydantic doesn't accept a compiled `re.Pattern` 
+here.
+
+But this pattern only matches one exact value, so running a regular expression 
+for it is more work than needed. The pattern is only added to the OpenAPI schema 
+(with `json_schema_extra`), and the value is checked by `_check_fixedquery`, an 
+`AfterValidator` that compares it with `"fixedquery"` directly. It raises the 
+same error (`string_pattern_mismatch`) that the pattern would.
+
+The `json_schema_extra` goes on the `str` itself, in `FixedQueryStr`, not on the 
+`Query()`. That way the pattern ends up next to `minLength` and `maxLength` in 
+the `string` part of the schema, the same place `pattern=` would put it, instead 
+of next to the `anyOf` with `null`.
+"""
+
+from pydantic import AfterValidator, Field
+from pydantic_core import PydanticCustomError
+
+FIXEDQUERY_PATTERN = "^fixedquery$"
+FixedQueryStr = Annotated[str, Field(json_schema_extra={"pattern": FIXEDQUERY_PATTERN})]
+
+def _check_fixedquery(value: str | None) -> str | None:
+    if value is not None and value != "fixedquery":
+        raise PydanticCustomError(
+            "string_pattern_mismatch",
+            "String should match pattern '{pattern}'",
+            {"pattern": FIXEDQUERY_PATTERN},
+        )
+    return value
+
 @app.get("/v4/items")
 async def read_items(
-    q: Annotated[Union[str, None], Query(min_length=3, max_length=50, regex="^fixedquery$")] = None
+    q: Annotated[
+        FixedQueryStr | None,
+        Query(min_length=3, max_length=50),
+        AfterValidator(_check_fixedquery),
+    ] = None
 ):
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
     if q:
-        results.update({"q": q})
-    return results
+        return {"items": ITEMS, "q": q}
+    return ITEMS_RESULTS
 
 """
 Default Values
@@ -244,12 +308,23 @@ Having a default value of any type, including 'None', makes the parameter
 optional (not required).
 """
 
+"""
+Note:
+The same `Query()` object can be used by more than one parameter, FastAPI makes 
+its own copy of it for each one. So the `Query()`s that are declared the same 
+way in several Path Operations below are created once: `QUERY_MIN_LENGTH_3` 
+(for `/v5/items` and `/v6/items/`) and `QUERY_LIST` (for the lists in 
+`/v7/items/`, `/v8/items` and `/v9/items/`).
+"""
+
+QUERY_MIN_LENGTH_3 = Query(min_length=3)
+QUERY_LIST = Query()
+
 @app.get("/v5/items")
-async def read_items(q: Annotated[str, Query(min_length=3)] = "fixedquery"):
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
+async def read_items(q: Annotated[str, QUERY_MIN_LENGTH_3] = "fixedquery"):
     if q:
-        results.update({"q": q})
-    return results
+        return {"items": ITEMS, "q": q}
+    return ITEMS_RESULTS
 
 """
 Make it Required
@@ -312,16 +387,23 @@ Tip:
 Remember that in most of the cases, when something is required, you 
 can simply omit the default, so you normally don't have to use ... nor
 'Required'.
+
+Note:
+Pydantic 2 removed `Required`, importing it from `pydantic` raises an
+`ImportError` (after going through Pydantic's V1 migration checks). What
+FastAPI itself uses for "no default" is `PydanticUndefined`, so that's imported
+directly, as `Required`. A `...` default doesn't work here with `Annotated` in
+this version of FastAPI, it ends up in the OpenAPI schema as the default value
+and the schema can't be generated.
 """
 
-from pydantic import Required
+from pydantic_core import PydanticUndefined as Required
 
 @app.get("/v6/items/")
-async def read_items(q: Annotated[str, Query(min_length=3)] = Required):
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
+async def read_items(q: Annotated[str, QUERY_MIN_LENGTH_3] = Required):
     if q:
-        results.update({"q": q})
-    return results
+        return {"items": ITEMS, "q": q}
+    return ITEMS_RESULTS
 
 """
 Query Parameter List / Multiple Values
@@ -333,10 +415,8 @@ in other way, to receive multiple values.
 For example, to declare a Query Parameter `q` that can appear 
 multiple times in the URL, you can write:
 """
-from typing import List
-
 @app.get("/v7/items/")
-async def read_items(q: Annotated[Union[List[str], None], Query()] = None):
+async def read_items(q: Annotated[list[str] | None, QUERY_LIST] = None):
     query_items = {"q": q}
     return query_items
 
@@ -380,7 +460,7 @@ The default of `q` will be: `["foo", "bar"]` and your response will be:
 """
 
 @app.get("/v8/items")
-async def read_items(q: Annotated[List[str], Query()] = ["foo", "bar"]):
+async def read_items(q: Annotated[list[str], QUERY_LIST] = ["foo", "bar"]):
     query_items = {"q": q}
     return query_items
 
@@ -397,7 +477,7 @@ list are integers. But `list` along wouldn't.
 """
 
 @app.get("/v9/items/")
-async def read_items(q: Annotated[list, Query()] = []):
+async def read_items(q: Annotated[list, QUERY_LIST] = []):
     query_items = {"q": q}
     return query_items
 
@@ -416,30 +496,36 @@ yet, although in most of the cases, the missing feature is already
 planned for development.
 """
 
+"""
+Note:
+The title and the description of `q` are the same in the Path Operations 
+below, so they are declared once, in `QUERY_TITLE` and `QUERY_DESCRIPTION`. 
+The `q` of `/v11/items/` is declared once too, as `QueryString`, an `Annotated` 
+alias any other Path Operation that takes the same `q` can reuse.
+"""
+
+QUERY_TITLE = "Query string"
+QUERY_DESCRIPTION = "Query string for the items to search in the database that have a good match"
+
+QueryString = Annotated[
+    str | None,
+    Query(title=QUERY_TITLE, description=QUERY_DESCRIPTION, min_length=3),
+]
+
 # You can add a `title`:
 @app.get("/v10/items/")
-async def read_items(q: Annotated[Union[str, None], Query(title="Query string", min_length=3)] = None):
+async def read_items(q: Annotated[str | None, Query(title=QUERY_TITLE, min_length=3)] = None):
     results = {"items": [{"item_id": "foo"}, {"item_id": "bar"}]}
     if q:
-        results.update({"q": q})
+        results["q"] = q
     return results
 
 # And a description
 @app.get("/v11/items/")
-async def read_items(
-    q: Annotated[
-        Union[str, None],
-        Query(
-            title="Query string",
-            description="Query string for the items to search in the database that have a good match",
-            min_length=3,
-        ),
-    ] = None
-):
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
+async def read_items(q: QueryString = None):
     if q:
-        results.update({"q": q})
-    return results
+        return {"items": ITEMS, "q": q}
+    return ITEMS_RESULTS
 
 """
 Alias Parameters
@@ -456,11 +542,10 @@ Then you can declare an `alias`, and that alias is what will be used to find the
 """
 
 @app.get("/v12/items/")
-async def read_items(q: Annotated[Union[str, None], Query(alias="item-query")] = None):
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
+async def read_items(q: Annotated[str | None, Query(alias="item-query")] = None):
     if q:
-        results.update({"q": q})
-    return results
+        return {"items": ITEMS, "q": q}
+    return ITEMS_RESULTS
 
 """
 Deprecating Parameters
@@ -476,22 +561,21 @@ Then pass the parameter `deprecated=True` to `Query`:
 @app.get("/v13/items/")
 async def read_items(
     q: Annotated[
-        Union[str, None],
+        FixedQueryStr | None,
         Query(
             alias="item-query",
-            title="Query string",
-            description="Query string for the items to search in the database that have a good match",
+            title=QUERY_TITLE,
+            description=QUERY_DESCRIPTION,
             min_length=3,
             max_length=50,
-            regex="^fixedquery$",
             deprecated=True
         ),
+        AfterValidator(_check_fixedquery),
     ] = None
 ):
-    results = {"items": [{"item_id": "Foo"}, {"item_id": "Bar"}]}
     if q:
-        results.update({"q": q})
-    return results
+        return {"items": ITEMS, "q": q}
+    return ITEMS_RESULTS
 
 """
 Exclude From OpenAPI 
@@ -502,9 +586,21 @@ of `Query` to `False`:
 """
 
 @app.get("/v14/items/")
-async def read_items(hidden_query: Annotated[Union[str, None], Query(include_in_schema=False)] = None):
+async def read_items(hidden_query: Annotated[str | None, Query(include_in_schema=False)] = None):
     if hidden_query:
         return {"hidden_query": hidden_query}
     else:
         return {"hidden_query": "Not found"}
 
+"""
+Note:
+FastAPI builds the OpenAPI schema the first time `app.openapi()` is called 
+(the first request to `/openapi.json` or `/docs`) and keeps it in 
+`app.openapi_schema`, every other call returns that same `dict`. Calling it here, 
+once all the Path Operations are declared, builds it when the app is loaded, 
+so the first request to the docs doesn't have to wait for it (and a mistake 
+in the schema shows up right away).
+"""
+
+app.openapi()
+
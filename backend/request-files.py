@@ -17,6 +17,7 @@ Import `File` and `UploadFile` from `fastapi`.
 
 from typing import Annotated
 from fastapi import FastAPI, File, UploadFile
+from fastapi.responses import ORJSONResponse
 
 """
 Define File Parameters
@@ -25,11 +26,49 @@ Create file parameters the same way you would for
 `Body` or `Form`.
 """
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+
+"""
+Note:
+The `bytes` versions of the Path Operations in this file (the `/files/` ones) 
+receive an `UploadFile` instead. For a `bytes` parameter FastAPI reads the whole 
+file into memory, only for these functions to take its `len()`. The 
+`UploadFile` is already counted while the upload is received (its `size`), and 
+its contents stay in the temporary file (on disk once it's bigger than 1 MB), 
+so they are never copied into memory.
+
+`file_size()` uses that `size`. An empty upload has a size of `0`, so 
+`/v2/files/` still answers "No file sent" for it, like it did for empty 
+`bytes`. An `UploadFile` created some other way (e.g. in 
+a test) might not have it, for those it seeks to the end of the file to get it 
+(and back to where it was), still without reading it.
+
+For several files, `file_sizes()` first takes all the `size`s at once, which 
+(for the usual uploads, that all have one) is only an attribute lookup per file, 
+instead of calling `file_size()` for each one.
+
+The app's `default_response_class` is `ORJSONResponse`, so the `dict`s returned 
+are serialized with `orjson` instead of `json.dumps()`. The form in `main()` is 
+still sent as HTML, it returns its own `HTMLResponse`.
+"""
+
+def file_size(file: UploadFile) -> int:
+    if file.size is not None:
+        return file.size
+    position = file.file.tell()
+    size = file.file.seek(0, 2)
+    file.file.seek(position)
+    return size
+
+def file_sizes(files: list[UploadFile]) -> list[int]:
+    sizes = [file.size for file in files]
+    if None in sizes:
+        return [file_size(file) for file in files]
+    return sizes
 
 @app.post("/v1/files/")
-async def create_file(file: Annotated[bytes, File()]):
-    return {"file_size": len(file)}
+async def create_file(file: Annotated[UploadFile, File()]):
+    return {"file_size": file_size(file)}
 
 """
 Info
@@ -177,11 +216,11 @@ a default value of `None`:
 
 # Python 3/10
 @app.post("/v2/files/")
-async def create_file(file: Annotated[bytes | None, File()] = None):
-    if not file:
+async def create_file(file: Annotated[UploadFile | None, File()] = None):
+    if file is None or not file_size(file):
         return {"message": "No file sent"}
     else:
-        return {"file_size": len(file)}
+        return {"file_size": file_size(file)}
     
 @app.post("/v2/uploadfile/")
 async def create_upload_file(file: UploadFile | None = None):
@@ -197,12 +236,12 @@ You can also use `File()` with `UploadFile`, for example, to set additional meta
 """
 
 @app.post("/v3/files/")
-async def create_file(file: Annotated[bytes, File(description="A file read as bytes")]):
-    return {"file_size": len(file)}
+async def create_file(file: Annotated[UploadFile, File(description="A file, only its size is read")]):
+    return {"file_size": file_size(file)}
 
 @app.post("/v3/uploadfile/")
 async def create_upload_file(
-    file: Annotated[UploadFile, File(desctiption="A file read as UploadFile")],
+    file: Annotated[UploadFile, File(description="A file read as UploadFile")],
 ):
     return {"filename": file.filename}
 
@@ -220,8 +259,8 @@ You will receive, as declared, a `list` of `bytes`, or `UploadFile`s.
 """
 
 @app.post("/v4/files/")
-async def create_files(files: Annotated[list[bytes], File()]):
-    return {"file_sizes": [len(file) for file in files]}
+async def create_files(files: Annotated[list[UploadFile], File()]):
+    return {"file_sizes": file_sizes(files)}
 
 @app.post("/v4/uploadfiles")
 async def create_upload_files(files: list[UploadFile]):
@@ -229,9 +268,15 @@ async def create_upload_files(files: list[UploadFile]):
 
 from fastapi.responses import HTMLResponse
 
-@app.get("/")
-async def main():
-    content = """
+"""
+Note:
+The page returned by `main()` never changes, so its HTML is encoded to `bytes` 
+once, in `MAIN_PAGE_BYTES`, and each request only wraps them in a new 
+`HTMLResponse`. The `HTMLResponse` itself isn't shared: a `Response` can carry 
+`background` tasks and headers that belong to one request only.
+"""
+
+MAIN_PAGE_BYTES = b"""
 <body>
 <form action="/files/" enctype="multipart/form-data" method="post">
 <input name="files" type="file" multiple>
@@ -243,7 +288,10 @@ async def main():
 </form>
 </body>
 """
-    return HTMLResponse(content=content)
+
+@app.get("/")
+async def main():
+    return HTMLResponse(content=MAIN_PAGE_BYTES)
 
 """
 Technical Details
@@ -264,9 +312,9 @@ parameters, even for `UploadFile`.
 
 @app.post("/v5/files/")
 async def create_files(
-    files: Annotated[list[bytes], File(description="Multiple files as bytes")],
+    files: Annotated[list[UploadFile], File(description="Multiple files, only their sizes are read")],
 ):
-    return {"file_sizes": [len(file) for file in files]}
+    return {"file_sizes": file_sizes(files)}
 
 @app.post("/v5/uploadfiles/")
 async def create_upload_files(
@@ -165,13 +165,47 @@ in the `tokenUrl` parameter. This parameter contains the URL that the client
 and `password` in order to get a token.
 """
 
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.security import OAuth2PasswordBearer
 from typing_extensions import Annotated
 
 app = FastAPI()
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+"""
+Note:
+`OAuth2PasswordBearer` gets the `Authorization` header through 
+`request.headers` (which decodes it to a `str`), splits it at the first space 
+and lowercases the scheme, on every request. `BearerScheme` looks for the raw 
+header in the ASGI scope directly and checks the `bytes`, only the token is 
+decoded. It accepts and rejects the same headers (the scheme `bearer` in any 
+case, and the token is everything after the first space), raises the same 
+401, and the security scheme in OpenAPI stays the same.
+
+There's no need to keep the token around (e.g. in `request.state`) for other 
+dependencies that use `oauth2_scheme` in the same request: FastAPI already 
+calls it only once per request and gives all of them that same value.
+"""
+
+
+class BearerScheme(OAuth2PasswordBearer):
+    async def __call__(self, request: Request) -> str | None:
+        for name, value in request.scope["headers"]:
+            if name == b"authorization":
+                scheme = value[:7].lower()
+                if scheme == b"bearer ":
+                    return value[7:].decode("latin-1")
+                if scheme == b"bearer":
+                    return ""
+                break
+        if self.auto_error:
+            raise HTTPException(
+                status_code=401,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return None
+
+oauth2_scheme = BearerScheme(tokenUrl="token", scheme_name="OAuth2PasswordBearer")
 
 @app.get("/v1/items/")
 async def read_items(token: Annotated[str, Depends(oauth2_scheme)]):
@@ -16,9 +16,17 @@ You could create a first dependency ("dependable") like:
 
 from typing import Union
 from fastapi import Cookie, Depends, FastAPI
+from fastapi.responses import ORJSONResponse
 from typing_extensions import Annotated
 
-app = FastAPI(root_path="/api")
+"""
+Note:
+The responses of this app are serialized with `orjson` (`ORJSONResponse` is its 
+`default_response_class`), which is faster than the `json.dumps()` used by 
+the default `JSONResponse`.
+"""
+
+app = FastAPI(root_path="/api", default_response_class=ORJSONResponse)
 
 def query_extractor(q: Union[str, None] = None):
     return q
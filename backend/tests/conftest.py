@@ -0,0 +1,25 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+BACKEND = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND))
+
+
+@pytest.fixture
+def lesson_client():
+    """Build a `TestClient` for a lesson (its `app`, or its `router` in a new app)."""
+
+    def make(name: str) -> TestClient:
+        lesson = importlib.import_module(name)
+        app = getattr(lesson, "app", None)
+        if app is None:
+            app = FastAPI()
+            app.include_router(lesson.router)
+        return TestClient(app)
+
+    return make
@@ -0,0 +1,37 @@
+URL = "/multiple-parameters/v2/items/5"
+
+ITEM = {"name": "Foo", "description": "The Pretender", "price": 42.0, "tax": 3.2}
+USER = {"username": "dave", "full_name": "Dave Grohl"}
+
+
+def test_item_and_user(lesson_client):
+    client = lesson_client("body-multiple-parameters")
+    response = client.put(URL, json={"item": ITEM, "user": USER})
+    assert response.status_code == 200
+    assert response.json() == {"item_id": 5, "item": ITEM, "user": USER}
+
+
+def test_errors_from_both_fields_are_reported(lesson_client):
+    client = lesson_client("body-multiple-parameters")
+    response = client.put(
+        URL, json={"item": {"name": "Foo", "price": "cheap"}, "user": {"full_name": "Dave"}}
+    )
+    assert response.status_code == 422
+    locs = [error["loc"] for error in response.json()["detail"]]
+    assert locs == [["body", "item", "price"], ["body", "user", "username"]]
+
+
+def test_missing_fields_are_reported_with_invalid_ones(lesson_client):
+    client = lesson_client("body-multiple-parameters")
+    response = client.put(URL, json={"item": {"name": "Foo"}})
+    assert response.status_code == 422
+    locs = [error["loc"] for error in response.json()["detail"]]
+    assert locs == [["body", "item", "price"], ["body", "user"]]
+
+
+def test_invalid_json(lesson_client):
+    client = lesson_client("body-multiple-parameters")
+    response = client.put(
+        URL, content=b'{"item": ', headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 422
@@ -0,0 +1,33 @@
+URL = "/path-operation-decorators/v1/items/"
+
+
+def test_missing_headers_are_all_reported(lesson_client):
+    client = lesson_client("dependencies-in-path-operation-decorators")
+    response = client.get(URL)
+    assert response.status_code == 422
+    locs = [error["loc"] for error in response.json()["detail"]]
+    assert locs == [["header", "x-token"], ["header", "x-key"]]
+
+
+def test_invalid_token(lesson_client):
+    client = lesson_client("dependencies-in-path-operation-decorators")
+    response = client.get(URL, headers={"X-Token": "bad", "X-Key": "fake-super-secret-key"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "X-Token header invalid"}
+
+
+def test_valid_headers(lesson_client):
+    client = lesson_client("dependencies-in-path-operation-decorators")
+    response = client.get(
+        URL,
+        headers={"X-Token": "fake-super-secret-token", "X-Key": "fake-super-secret-key"},
+    )
+    assert response.status_code == 200
+    assert response.json() == [{"item": "Foo"}, {"item": "Bar"}]
+
+
+def test_openapi_documents_headers_and_422(lesson_client):
+    client = lesson_client("dependencies-in-path-operation-decorators")
+    operation = client.get("/openapi.json").json()["paths"][URL]["get"]
+    assert [p["name"] for p in operation["parameters"]] == ["x-token", "x-key"]
+    assert "422" in operation["responses"]
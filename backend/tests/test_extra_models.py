@@ -0,0 +1,84 @@
+import pytest
+
+INTERNAL_URL = "/v1/user/internal"
+TOKEN = {"X-Token": "fake-super-secret-token"}
+
+USER = {
+    "username": "john",
+    "password": "secret",
+    "email": "john.doe@example.com",
+    "full_name": "John Doe",
+}
+USER_OUT = {"username": "john", "email": "john.doe@example.com", "full_name": "John Doe"}
+
+
+def test_internal_user(lesson_client):
+    client = lesson_client("extra-models")
+    response = client.post(INTERNAL_URL, json=USER, headers=TOKEN)
+    assert response.status_code == 200
+    assert response.json() == USER_OUT
+    assert "hashed_password" not in response.text
+
+
+def test_internal_user_bad_token(lesson_client):
+    client = lesson_client("extra-models")
+    response = client.post(INTERNAL_URL, json=USER, headers={"X-Token": "bad"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "X-Token header invalid"}
+
+
+@pytest.mark.parametrize("body", [b'{"username": ', b"[]", b'"john"', b"null"])
+def test_internal_user_body_not_an_object(lesson_client, body):
+    client = lesson_client("extra-models")
+    response = client.post(
+        INTERNAL_URL, content=body, headers={**TOKEN, "Content-Type": "application/json"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("missing", ["username", "password", "email"])
+def test_internal_user_missing_field(lesson_client, missing):
+    client = lesson_client("extra-models")
+    body = {key: value for key, value in USER.items() if key != missing}
+    response = client.post(INTERNAL_URL, json=body, headers=TOKEN)
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("field, value", [("username", 1), ("email", None), ("full_name", [])])
+def test_internal_user_field_of_wrong_type(lesson_client, field, value):
+    client = lesson_client("extra-models")
+    response = client.post(INTERNAL_URL, json={**USER, field: value}, headers=TOKEN)
+    assert response.status_code == 400
+
+
+BULK_URL = "/v1/users/bulk"
+
+
+def test_bulk_users(lesson_client):
+    client = lesson_client("extra-models")
+    jane = {**USER, "username": "jane", "full_name": None}
+    response = client.post(BULK_URL, json=[USER, jane])
+    assert response.status_code == 200
+    assert response.json() == [USER_OUT, {**USER_OUT, "username": "jane", "full_name": None}]
+    assert "hashed_password" not in response.text
+
+
+def test_bulk_users_empty_list(lesson_client):
+    client = lesson_client("extra-models")
+    response = client.post(BULK_URL, json=[])
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_bulk_users_invalid_user_is_reported_by_index(lesson_client):
+    client = lesson_client("extra-models")
+    response = client.post(BULK_URL, json=[USER, {**USER, "email": "not-an-email"}])
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [["body", 1, "email"]]
+
+
+def test_bulk_users_body_must_be_a_list(lesson_client):
+    client = lesson_client("extra-models")
+    response = client.post(BULK_URL, json=USER)
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [["body"]]